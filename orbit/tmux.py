@@ -9,124 +9,81 @@ class TmuxError(Exception):
     pass
 
 
+def _run(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(["tmux", *args], capture_output=True, text=True)
+
+
 def inside_tmux() -> bool:
     return bool(os.environ.get("TMUX"))
 
 
 def session_exists(name: str) -> bool:
-    result = subprocess.run(
-        ["tmux", "has-session", "-t", name],
-        capture_output=True,
-    )
+    result = _run("has-session", "-t", name)
     return result.returncode == 0
 
 
 def new_session(name: str, start_dir: Path) -> None:
-    result = subprocess.run(
-        ["tmux", "new-session", "-d", "-s", name, "-c", str(start_dir)],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("new-session", "-d", "-s", name, "-c", str(start_dir))
     if result.returncode != 0:
         raise TmuxError(f"Failed to create session '{name}': {result.stderr.strip()}")
 
 
 def kill_session(name: str) -> None:
-    result = subprocess.run(
-        ["tmux", "kill-session", "-t", name],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("kill-session", "-t", name)
     if result.returncode != 0:
         raise TmuxError(f"Failed to kill session '{name}': {result.stderr.strip()}")
 
 
 def set_environment(session: str, key: str, value: str) -> None:
-    result = subprocess.run(
-        ["tmux", "set-environment", "-t", session, key, value],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("set-environment", "-t", session, key, value)
     if result.returncode != 0:
         raise TmuxError(f"Failed to set environment: {result.stderr.strip()}")
 
 
 def set_option(session: str, option: str, value: str) -> None:
-    result = subprocess.run(
-        ["tmux", "set-option", "-t", session, option, value],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("set-option", "-t", session, option, value)
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
 
 
 def set_window_option(session: str, window: str, option: str, value: str) -> None:
-    result = subprocess.run(
-        ["tmux", "set-window-option", "-t", f"{session}:{window}", option, value],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("set-window-option", "-t", f"{session}:{window}", option, value)
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
 
 
 def set_pane_title(target: str, title: str) -> None:
-    result = subprocess.run(
-        ["tmux", "select-pane", "-t", target, "-T", title],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("select-pane", "-t", target, "-T", title)
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
 
 
 def send_keys(target: str, command: str) -> None:
-    result = subprocess.run(
-        ["tmux", "send-keys", "-t", target, command, "Enter"],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("send-keys", "-t", target, command, "Enter")
     if result.returncode != 0:
         raise TmuxError(f"Failed to send keys to '{target}': {result.stderr.strip()}")
 
 
 def split_window(session: str, window: str, start_dir: Path) -> None:
-    result = subprocess.run(
-        ["tmux", "split-window", "-t", f"{session}:{window}", "-c", str(start_dir)],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("split-window", "-t", f"{session}:{window}", "-c", str(start_dir))
     if result.returncode != 0:
         raise TmuxError(f"Failed to split window: {result.stderr.strip()}")
 
 
 def select_layout(session: str, window: str, layout: str) -> None:
-    result = subprocess.run(
-        ["tmux", "select-layout", "-t", f"{session}:{window}", layout],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("select-layout", "-t", f"{session}:{window}", layout)
     if result.returncode != 0:
         raise TmuxError(f"Failed to select layout: {result.stderr.strip()}")
 
 
 def choose_session() -> None:
-    result = subprocess.run(
-        ["tmux", "choose-tree", "-s"],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("choose-tree", "-s")
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
 
 
 def switch_client(name: str) -> None:
-    result = subprocess.run(
-        ["tmux", "switch-client", "-t", name],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("switch-client", "-t", name)
     if result.returncode != 0:
         raise TmuxError(f"Failed to switch client to '{name}': {result.stderr.strip()}")
 
@@ -139,14 +96,18 @@ def attach_and_choose() -> None:
     os.execvp("tmux", ["tmux", "attach-session", ";", "choose-tree", "-s"])
 
 
+# Indexed by pane count, clamped to the last entry.
+_LAYOUTS: tuple[str | None, ...] = (
+    None,
+    None,
+    "even-horizontal",
+    "main-vertical",
+    "tiled",
+)
+
+
 def _layout_for(n: int) -> str | None:
-    if n <= 1:
-        return None
-    if n == 2:
-        return "even-horizontal"
-    if n == 3:
-        return "main-vertical"
-    return "tiled"
+    return _LAYOUTS[min(max(n, 0), len(_LAYOUTS) - 1)]
 
 
 def setup_panes(
@@ -177,11 +138,7 @@ def setup_panes(
 
 def _pane_base_index(session: str, window: str) -> int:
     """Return the index of the first pane in a window."""
-    result = subprocess.run(
-        ["tmux", "list-panes", "-t", f"{session}:{window}", "-F", "#{pane_index}"],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("list-panes", "-t", f"{session}:{window}", "-F", "#{pane_index}")
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
     return int(result.stdout.strip().splitlines()[0])
@@ -189,42 +146,26 @@ def _pane_base_index(session: str, window: str) -> int:
 
 def first_window_index(session: str) -> int:
     """Return the index of the first window in a session."""
-    result = subprocess.run(
-        ["tmux", "list-windows", "-t", session, "-F", "#{window_index}"],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("list-windows", "-t", session, "-F", "#{window_index}")
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
     return int(result.stdout.strip().splitlines()[0])
 
 
 def rename_window(session: str, index: int, name: str) -> None:
-    result = subprocess.run(
-        ["tmux", "rename-window", "-t", f"{session}:{index}", name],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("rename-window", "-t", f"{session}:{index}", name)
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
 
 
 def new_window(session: str, name: str, start_dir: Path) -> None:
-    result = subprocess.run(
-        ["tmux", "new-window", "-t", session, "-n", name, "-c", str(start_dir)],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("new-window", "-t", session, "-n", name, "-c", str(start_dir))
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
 
 
 def select_window(session: str, index: int) -> None:
-    result = subprocess.run(
-        ["tmux", "select-window", "-t", f"{session}:{index}"],
-        capture_output=True,
-        text=True,
-    )
+    result = _run("select-window", "-t", f"{session}:{index}")
     if result.returncode != 0:
         raise TmuxError(result.stderr.strip())
 
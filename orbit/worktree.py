@@ -8,13 +8,17 @@ class WorktreeError(Exception):
     pass
 
 
+_SLUG_CHARS = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789-")
+_SLUG_TABLE = bytes(c if c in _SLUG_CHARS else ord("-") for c in range(256))
+_HYPHEN_RUNS = re.compile(rb"-{2,}")
+
+
 def slugify(branch: str) -> str:
-    slug = branch.lower()
-    slug = slug.replace("/", "-")
-    slug = re.sub(r"[^a-z0-9-]", "-", slug)
-    slug = re.sub(r"-+", "-", slug)
-    slug = slug.strip("-")
-    return slug[:40]
+    # Non-ASCII characters encode to "?", which the table maps to "-" like
+    # any other character outside [a-z0-9-].
+    slug = branch.lower().encode("ascii", "replace").translate(_SLUG_TABLE)
+    slug = _HYPHEN_RUNS.sub(b"-", slug)
+    return slug.strip(b"-")[:40].decode("ascii")
 
 
 def detect_branch(repo_path: Path) -> str:
@@ -44,7 +48,8 @@ def get_remotes(repo_path: Path) -> list[str]:
     )
     if result.returncode != 0:
         raise WorktreeError(f"Failed to list remotes: {result.stderr.strip()}")
-    return sorted(r for r in result.stdout.splitlines() if r)
+    # Remote names can't contain whitespace, so split() also drops blank lines.
+    return sorted(result.stdout.split())
 
 
 def remote_branch_exists(repo_path: Path, remote: str, branch: str) -> bool:
@@ -106,9 +111,24 @@ def detect_default_branch(repo_path: Path, remote: str) -> str | None:
         if ref.startswith(prefix):
             return ref[len(prefix) :]
 
-    for candidate in ("main", "master", "develop"):
-        if branch_exists_locally(repo_path, candidate):
-            return candidate
+    # Last resort: conventional default branch names, checked in one query.
+    candidates = ("main", "master", "develop")
+    result = subprocess.run(
+        [
+            "git",
+            "for-each-ref",
+            "--format=%(refname:strip=2)",
+            *(f"refs/heads/{candidate}" for candidate in candidates),
+        ],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode == 0:
+        local = set(result.stdout.splitlines())
+        for candidate in candidates:
+            if candidate in local:
+                return candidate
     return None
 
 
@@ -249,13 +269,14 @@ def get_main_repo_path(worktree_path: Path) -> Path:
 
 
 def has_uncommitted_changes(worktree_path: Path) -> bool:
+    # A read-only check: don't take index.lock to refresh the stat cache, which
+    # could collide with git commands the user is running in the same tree.
     result = subprocess.run(
-        ["git", "status", "--short"],
+        ["git", "--no-optional-locks", "status", "--porcelain"],
         cwd=worktree_path,
         capture_output=True,
-        text=True,
     )
-    return bool(result.stdout.strip())
+    return bool(result.stdout)
 
 
 def sync_untracked_to_worktree(
@@ -267,6 +288,9 @@ def sync_untracked_to_worktree(
 
     Uses git to enumerate all untracked files (including ignored ones like
     .env), then symlinks any that match one of the given fnmatch patterns.
+    Files are symlinked rather than hardlinked so the worktree keeps following
+    the source even when an editor saves it by writing a temp file and
+    renaming it over the original.
 
     Patterns are path-aware:
     - A pattern without ``/`` (e.g. ``.*``, ``.env``) matches only names at
@@ -291,41 +315,44 @@ def sync_untracked_to_worktree(
 
     root_patterns = [p for p in patterns if "/" not in p]
     path_patterns = [p for p in patterns if "/" in p]
-    already_synced: set[Path] = set()
+    # Matched paths already handled (synced or skipped), so the many entries
+    # under a matched directory resolve with one set lookup.
+    handled: set[str] = set()
     synced: list[str] = []
 
     def _is_glob(pattern: str) -> bool:
         return any(c in pattern for c in ("*", "?", "["))
 
     for entry in result.stdout.splitlines():
-        file_rel = Path(entry)
+        parts = entry.split("/")
+        if parts[0] in handled:
+            continue
 
         # Check ancestors first (shallowest match wins), then the file itself.
-        matched: Path | None = None
+        matched: str | None = None
         matched_pattern: str | None = None
-        parts = file_rel.parts
-        candidates = [Path(*parts[: i + 1]) for i in range(len(parts))]
-        for candidate in candidates:
-            # Name patterns: only match entries directly under the repo root.
-            if candidate.parent == Path("."):
-                for p in root_patterns:
-                    if fnmatch.fnmatch(candidate.name, p):
+        # Name patterns: only match entries directly under the repo root.
+        for p in root_patterns:
+            if fnmatch.fnmatchcase(parts[0], p):
+                matched = parts[0]
+                matched_pattern = p
+                break
+        if matched is None and path_patterns:
+            # Path patterns: match against the full relative path.
+            candidate = ""
+            for part in parts:
+                candidate = f"{candidate}/{part}" if candidate else part
+                for p in path_patterns:
+                    if fnmatch.fnmatchcase(candidate, p):
                         matched = candidate
                         matched_pattern = p
                         break
-            if matched is not None:
-                break
-            # Path patterns: match against the full relative path.
-            for p in path_patterns:
-                if fnmatch.fnmatch(str(candidate), p):
-                    matched = candidate
-                    matched_pattern = p
+                if matched is not None:
                     break
-            if matched is not None:
-                break
 
-        if matched is None or matched in already_synced:
+        if matched is None or matched in handled:
             continue
+        handled.add(matched)
 
         src = source_path / matched
         # Wildcard patterns (e.g. ".*") must not auto-symlink directories.
@@ -333,12 +360,11 @@ def sync_untracked_to_worktree(
         if src.is_dir() and matched_pattern is not None and _is_glob(matched_pattern):
             continue
 
-        already_synced.add(matched)
         dst = worktree_path / matched
         if dst.exists() or dst.is_symlink():
             continue
         dst.parent.mkdir(parents=True, exist_ok=True)
         dst.symlink_to(src.resolve())
-        synced.append(str(matched))
+        synced.append(matched)
 
     return synced
@@ -1,8 +1,42 @@
+import os
+import shutil
 import subprocess
+import sys
+import tempfile
+from pathlib import Path
 
 import pytest
 
 from orbit.tmux import TmuxError
+from tests.helpers import GIT, _git
+
+
+def pytest_configure(config):
+    """Keep pytest's temp directories on tmpfs where available.
+
+    Nearly every test builds throwaway git repos under ``tmp_path``; putting
+    them in RAM avoids disk writes.  An explicit ``PYTEST_DEBUG_TEMPROOT`` or
+    ``--basetemp`` still wins.
+    """
+    if sys.platform == "linux" and os.access("/dev/shm", os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests that need git up front when it isn't installed.
+
+    Covers integration-marked tests and anything built on ``git_repo``, so
+    they report a single clear reason instead of each failing on ENOENT.
+    """
+    if shutil.which("git") is not None:
+        return
+    skip_git = pytest.mark.skip(reason="git is not installed")
+    for item in items:
+        if (
+            item.get_closest_marker("integration")
+            or "_git_repo_template" in item.fixturenames
+        ):
+            item.add_marker(skip_git)
 
 
 @pytest.fixture(autouse=True)
@@ -20,31 +54,118 @@ def _prevent_execvp(monkeypatch):
     monkeypatch.setattr("orbit.tmux.os.execvp", _no_exec)
 
 
-@pytest.fixture
-def git_repo(tmp_path):
-    """Create a minimal git repo with one commit, suitable for worktree tests."""
-    repo = tmp_path / "repo"
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_tmux_server(worker_id):
+    """Give each pytest-xdist worker its own tmux server.
+
+    tmux places its server socket under ``TMUX_TMPDIR``, so workers running in
+    parallel can reuse the same session names without colliding.  ``TMUX`` is
+    cleared so a run started inside tmux doesn't talk to the user's server.
+
+    The directory lives directly under /tmp rather than pytest's basetemp:
+    socket paths are limited to 104 bytes on macOS, and a basetemp under
+    /private/var/folders/... pushes tmux's socket past that.
+    """
+    if worker_id == "master":
+        yield
+        return
+    tmux_tmpdir = tempfile.mkdtemp(prefix=f"orbit-tmux-{worker_id}-", dir="/tmp")
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("TMUX_TMPDIR", tmux_tmpdir)
+            mp.delenv("TMUX", raising=False)
+            yield
+            subprocess.run(
+                ["tmux", "kill-server"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+    finally:
+        shutil.rmtree(tmux_tmpdir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_git_config():
+    """Run git without the user's global or system config.
+
+    Keeps settings like ``init.defaultBranch`` or commit signing from leaking
+    into tests, and supplies an identity for repos the tests create directly.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+        mp.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        for role in ("AUTHOR", "COMMITTER"):
+            mp.setenv(f"GIT_{role}_NAME", "Test")
+            mp.setenv(f"GIT_{role}_EMAIL", "test@test.com")
+        yield
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory):
+    """Build the base repo for ``git_repo`` once per session."""
+    repo = tmp_path_factory.mktemp("git_template", numbered=False) / "repo"
     repo.mkdir()
-    subprocess.run(["git", "init", str(repo)], check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    _git("init", str(repo))
     (repo / "README.md").write_text("# Test\n")
     (repo / ".gitignore").write_text(".orbit/\n")
-    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=repo,
+    _git("add", ".", cwd=repo)
+    _git("commit", "-m", "Initial commit", cwd=repo)
+    return repo
+
+
+@pytest.fixture(scope="session")
+def default_branch(_git_repo_template):
+    """Name of the branch ``git init`` created in the template repo.
+
+    Read from the repo itself rather than from ``init.defaultBranch``, which
+    is unset under the isolated config and whose fallback varies by git
+    version.
+    """
+    return subprocess.run(
+        [GIT, "symbolic-ref", "--short", "HEAD"],
+        cwd=_git_repo_template,
         check=True,
         capture_output=True,
-    )
+        text=True,
+    ).stdout.strip()
+
+
+# Git never modifies object files or the sample hooks in place, so copies of
+# the template can share them; everything else (index, refs, working tree)
+# is written by tests and must be a real copy.
+_SHAREABLE_GIT_DIRS = (
+    f"{os.sep}.git{os.sep}objects{os.sep}",
+    f"{os.sep}.git{os.sep}hooks{os.sep}",
+)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    if any(part in src for part in _SHAREABLE_GIT_DIRS):
+        os.link(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+@pytest.fixture
+def git_repo(_git_repo_template, tmp_path):
+    """Create a minimal git repo with one commit, suitable for worktree tests.
+
+    The path is fully resolved, so tests can compare it directly against the
+    real paths git and orbit report (e.g. macOS's /var -> /private/var).
+    """
+    repo = Path(os.path.realpath(tmp_path)) / "repo"
+    shutil.copytree(_git_repo_template, repo, copy_function=_link_or_copy)
     return repo
+
+
+@pytest.fixture(scope="session")
+def bare_remote(_git_repo_template, tmp_path_factory):
+    """Bare clone of the template repo, built once per session.
+
+    Shared by every test that needs a remote, so treat it as read-only: add it
+    as a remote and fetch from it, but never push to it.  Tests that push
+    copy it into their own ``tmp_path`` first.
+    """
+    bare = tmp_path_factory.mktemp("bare_template", numbered=False) / "bare"
+    _git("clone", "--bare", str(_git_repo_template), str(bare))
+    return bare
@@ -0,0 +1,16 @@
+import shutil
+import subprocess
+
+# Resolved once so each setup call skips the PATH search.
+GIT = shutil.which("git") or "git"
+
+
+def _git(*args, **kwargs):
+    """Run a git setup command, discarding output the test doesn't inspect."""
+    return subprocess.run(
+        [GIT, *args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs,
+    )
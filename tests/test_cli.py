@@ -139,6 +139,7 @@ class TestCliCommands:
         assert result.exit_code == 0
         assert "No active orbits" in result.output
 
+    @pytest.mark.integration
     def test_list_shows_orbits(self, tmp_path, monkeypatch):
         from orbit.cli import cli
         from orbit.state import save_state
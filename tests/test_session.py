@@ -9,6 +9,7 @@ from orbit.models import Orbit, Planet
 from orbit.session import destroy, launch
 from orbit.state import State, load_state
 from orbit.tmux import TmuxError, kill_session, session_exists
+from tests.helpers import _git
 
 
 def make_planet(repo_path: Path, windows=None, sync_untracked=None) -> Planet:
@@ -275,25 +276,11 @@ class TestStart:
                 kill_session("test-taskid")
 
     def test_new_branch_branched_from_explicit_base(self, git_repo, tmp_path):
-        subprocess.run(
-            ["git", "checkout", "-b", "base-branch"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
+        _git("checkout", "-b", "base-branch", cwd=git_repo)
         (git_repo / "base-file.txt").write_text("from base\n")
-        subprocess.run(
-            ["git", "add", "."], cwd=git_repo, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "base commit"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "checkout", "-"], cwd=git_repo, check=True, capture_output=True
-        )
+        _git("add", ".", cwd=git_repo)
+        _git("commit", "-m", "base commit", cwd=git_repo)
+        _git("checkout", "-", cwd=git_repo)
 
         planet = make_planet(git_repo)
         config = make_config(planet)